@@ -22,20 +22,22 @@
 A script to get all e-mail addresses from users of this particular galaxy.
 """
 import argparse
-from typing import Callable, Dict, List
+import sys
+from typing import Callable, Dict, List, TYPE_CHECKING
 
-from bioblend.galaxy import GalaxyInstance
+if TYPE_CHECKING:  # bioblend is slow to import, only load it when needed.
+    from bioblend.galaxy import GalaxyInstance
 
 
-def print_user_emails(galaxy: GalaxyInstance) -> None:
+def print_user_emails(galaxy: "GalaxyInstance") -> None:
     user_info: List[Dict[str, str]] = galaxy.users.get_users()
-    for user in user_info:
-        email = user.get("email")
-        if email is not None:
-            print(email)
+    emails = [user["email"] for user in user_info
+              if user.get("email") is not None]
+    if emails:
+        sys.stdout.write("\n".join(emails) + "\n")
 
 
-COMMANDS: Dict[str, Callable[[GalaxyInstance], None]] = {
+COMMANDS: Dict[str, Callable[["GalaxyInstance"], None]] = {
     "user_emails": print_user_emails
 }
 AVAILABLE_COMMANDS = list(COMMANDS.keys())
@@ -61,6 +63,7 @@ def argument_parser():
 
 def main():
     args = argument_parser().parse_args()
+    from bioblend.galaxy import GalaxyInstance
     galaxy = GalaxyInstance(
         url=args.galaxy,
         key=args.api_key,